@@ -10,6 +10,8 @@ os.system('clear')
 input_TryAgain = 'n'
 StopRun = 'n'
 
+VALID_MSG_TYPES = frozenset(['35=D', '35=8'])
+
 
 while StopRun != 'y':
 
@@ -18,7 +20,7 @@ while StopRun != 'y':
 
         #Validate message
 
-        while input_InFIXMsg not in ['35=D', '35=8']:
+        while input_InFIXMsg not in VALID_MSG_TYPES:
                 print("ERROR: **Invalid message type**.")
 		print('')
                 input_TryAgain = raw_input ("Enter Again?\n[y/n] ")
@@ -14,6 +14,8 @@ clear = lambda: os.system('clear')
 input_TryAgain = 'n'
 StopRun = 'no'
 
+VALID_MSG_TYPES = frozenset(['35=D', '35=8'])
+
 while StopRun != 'yes':
 
 	#Prompt User for FIX message
@@ -21,7 +23,7 @@ while StopRun != 'yes':
 
 	#Validate message
 
-	while input_InFIXMsg not in ['35=D', '35=8']:
+	while input_InFIXMsg not in VALID_MSG_TYPES:
 		clear()
 		print("ERROR: **Invalid message type**")
 		print('')
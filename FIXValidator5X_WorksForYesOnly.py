@@ -10,6 +10,8 @@ from six.moves import input
 input_TryAgain = 'no'
 StopRun = 'no'
 
+VALID_MSG_TYPES = frozenset(['35=D', '35=8'])
+
 while StopRun != 'yes':
 
 	#Prompt User for FIX message
@@ -17,7 +19,7 @@ while StopRun != 'yes':
 
 	#Validate message
 
-	while input_InFIXMsg not in ['35=D', '35=8']:
+	while input_InFIXMsg not in VALID_MSG_TYPES:
 		print("Invalid message type. Please try again.")
 		input_TryAgain = raw_input ("Enter Again: ")
 		if input_TryAgain == ('yes'):
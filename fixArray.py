@@ -10,12 +10,11 @@ input_InFIXMsg=raw_input("Enter FIX Message: ")
 print("You entered \"" + input_InFIXMsg + "\"")
 
 def Convert(string):
-	li = list(string.split(","))
-	return li
+	return string.split(",")
 
 str1 = input_InFIXMsg
-print(Convert(str1))
 myList = Convert(str1)
+print(myList)
 print('')
 print (myList)
 print ('')
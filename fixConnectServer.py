@@ -6,17 +6,19 @@ import socket
 
 TCP_IP = '127.0.0.1'
 TCP_PORT = 5005
-BUFFER_SIZE = 20  # Normally 1024, but we want fast response
+BUFFER_SIZE = 65536  # One recv per FIX message, not one per 20 bytes
 
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Rebind right after a restart
 s.bind((TCP_IP, TCP_PORT))
 s.listen(1)
 
 conn, addr = s.accept()
-print 'Connection address:', addr
+conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # No Nagle delay on replies
+print("Connection address: " + str(addr))
 while 1:
 	data = conn.recv(BUFFER_SIZE)
 	if not data: break
-	print "received data:", data
-	conn.send(data)  # echo
+	print("received data: " + data.decode("latin-1"))
+	conn.sendall(data)  # echo
 conn.close()
@@ -10,29 +10,42 @@ QA:
 NOTE: Need to add syntax validation. That might need to be added to the FIX Validator as well. IF user violates expected syntax like wrong or no delimiter this will break. NEEDS TAG=VALUE,TAG=VALUE
 
 '''
-print("\n"*100)
+import sys
+from six.moves import input
+
+#Read from a pipe/file directly; only use the interactive prompt on a terminal
+def ReadLine(prompt):
+	if sys.stdin.isatty():
+		return input(prompt)
+	line = sys.stdin.readline()
+	if not line:
+		raise EOFError("No more input for: " + prompt)
+	return line.rstrip("\r\n")
+
+#Clear screen and home cursor; skip when output is piped
+if sys.stdout.isatty():
+	sys.stdout.write("\x1b[2J\x1b[H")
 print("FIX Array v3")
 print("SYNTAX: \'TAG=VALUE,TAG=VALUE\'")
 
 #Prompt User for FIX message
-input_InFIXMsg=raw_input("Enter FIX Message: ")
+input_InFIXMsg=ReadLine("Enter FIX Message: ")
 
 #Parse contents of input_InFIXMsg
 print("You entered \"" + input_InFIXMsg + "\"")
 
 def Convert(string):
-	li = list(string.split(","))
-	return li
+	return string.split(",")
 
 str1 = input_InFIXMsg
-print(Convert(str1))
 myList = Convert(str1)
+print(myList)
 #print (myList)   #Prints entire list
 
 #As proof on concept, will change anything to show it can be done. In this case changing the MsgType which is illogical but serves it's educational purpose:
 
 #Prompt user for new MsgType
-input_newMsgType=raw_input("Enter new MsgType: ")
+input_newMsgType=ReadLine("Enter new MsgType: ")
 
 #myList.insert(1,input_newMsgType) #Inserts a NEW item into list; NOT replace
 myList[1]=input_newMsgType